@@ -70,19 +70,21 @@ class CLI:
             """
             arg_name = arg_func.__name__[4:]
             arg_doc = arg_func.__doc__
+            # Inspect the signature once; it decides which kind of argument this is.
+            param_count = len(signature(arg_func).parameters)
             # Capture the default arg
-            if len(signature(arg_func).parameters) == 1 and arg_func.abbreviation == "":  # type: ignore
+            if param_count == 1 and arg_func.abbreviation == "":  # type: ignore
                 _parser.add_argument(arg_name, nargs="*", help=arg_doc)
 
             # Transitive functions
-            elif len(signature(arg_func).parameters) == 1:
+            elif param_count == 1:
                 arg_abbreviation = arg_func.abbreviation  # type: ignore
                 _parser.add_argument(
                     arg_abbreviation, type=str, nargs="?", dest=arg_name, help=arg_doc
                 )
 
             # Next, intransitive functions
-            elif len(signature(arg_func).parameters) == 0:
+            elif param_count == 0:
                 arg_abbreviation = arg_func.abbreviation  # type: ignore
                 _parser.add_argument(
                     arg_abbreviation, action="store_true", dest=arg_name, help=arg_doc
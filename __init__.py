@@ -1,13 +1,38 @@
-from Chain.chain.chain import Chain
-from Chain.prompt.prompt import Prompt
-from Chain.model.model import Model
-from Chain.response.response import Response
-from Chain.parser.parser import Parser
-from Chain.message.message import Message, Messages, create_system_message
-from Chain.message.messagestore import MessageStore
-from Chain.cache.cache import ChainCache
-from Chain.chat.chat import Chat
-from Chain.react.ReACT import ReACT
+"""
+Public API for the Chain package.
+Exports are resolved lazily (PEP 562), so `from Chain import Prompt` doesn't pay for the LLM SDKs, instructor, or rich.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Chain.chain.chain import Chain
+    from Chain.prompt.prompt import Prompt
+    from Chain.model.model import Model
+    from Chain.response.response import Response
+    from Chain.parser.parser import Parser
+    from Chain.message.message import Message, Messages, create_system_message
+    from Chain.message.messagestore import MessageStore
+    from Chain.cache.cache import ChainCache
+    from Chain.chat.chat import Chat
+    from Chain.react.ReACT import ReACT
+
+# Where each export lives.
+_exports = {
+    "Chain": "Chain.chain.chain",
+    "Prompt": "Chain.prompt.prompt",
+    "Model": "Chain.model.model",
+    "Parser": "Chain.parser.parser",
+    "Response": "Chain.response.response",
+    "Message": "Chain.message.message",
+    "MessageStore": "Chain.message.messagestore",
+    "create_system_message": "Chain.message.message",
+    "Messages": "Chain.message.message",
+    "ChainCache": "Chain.cache.cache",
+    "Chat": "Chain.chat.chat",
+    "ReACT": "Chain.react.ReACT",
+}
 
 
 __all__ = [
@@ -24,3 +49,18 @@ __all__ = [
     "Chat",
     "ReACT",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Imports the export's module on first access, then caches it in the package namespace.
+    """
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
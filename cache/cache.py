@@ -36,15 +36,20 @@ class ChainCache:
     def __init__(self, db_name: str):
         self.db_name = db_name
         self.conn, self.cursor = self.load_db()
-        self.cached_requests = self.retrieve_cached_requests()
-        self.cache_dict = self.generate_in_memory_dict(self.cached_requests)
+        self.cache_dict = self.load_cache_dict()
 
     def load_db(self) -> tuple[sqlite3.Connection, sqlite3.Cursor]:
         conn = sqlite3.connect(self.db_name)
+        # WAL lets several processes read the cache while one writes, and makes each insert's commit cheaper.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
         cursor.execute(
             "CREATE TABLE IF NOT EXISTS cached_requests (user_input TEXT, llm_output TEXT, model TEXT)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cached_requests_lookup ON cached_requests (user_input, model)"
+        )
         return conn, cursor
 
     def insert_cached_request(self, cached_request: CachedRequest):
@@ -66,24 +71,47 @@ class ChainCache:
         data = self.cursor.fetchall()
         return {CachedRequest(*row) for row in data}
 
-    def generate_in_memory_dict(self, cachedrequests: set[CachedRequest]) -> dict:
-        return {(cr.user_input, cr.model): cr.llm_output for cr in cachedrequests}
+    def load_cache_dict(self) -> dict:
+        """
+        Builds the in-memory dict straight from the table.
+        Rows were regularized by CachedRequest when inserted, so we don't re-validate each one on load.
+        """
+        self.cursor.execute("SELECT user_input, model, llm_output FROM cached_requests")
+        return {
+            (user_input, model): llm_output
+            for user_input, model, llm_output in self.cursor.fetchall()
+        }
 
     def cache_lookup(self, user_input: str | list, model: str) -> str | None:
         """
         Checks if there is a match for the CacheEntry, returns if yes, returns None if no.
         """
-        # Regularize this, like we do with CachedRequest class
-        if isinstance(user_input, list):
-            user_input = user_input[-1].content
-        user_input = str(user_input).strip()
-        key = (user_input, model)
-        try:
-            value = self.cache_dict[key]
-        except:
-            value = None
+        # Regularize this, like we do with CachedRequest class. Plain strings (the usual case) skip the conversions.
+        if type(user_input) is not str:
+            if isinstance(user_input, list):
+                user_input = user_input[-1].content
+            user_input = str(user_input)
+        key = (user_input.strip(), model)
+        value = self.cache_dict.get(key)
+        if value is None:
+            value = self.db_lookup(key)
         return value
 
+    def db_lookup(self, key: tuple[str, str]) -> str | None:
+        """
+        Falls back to the database for requests cached by other processes since we loaded.
+        Hits are added to our in-memory dict.
+        """
+        self.cursor.execute(
+            "SELECT llm_output FROM cached_requests WHERE user_input = ? AND model = ? LIMIT 1",
+            key,
+        )
+        row = self.cursor.fetchone()
+        if row is None:
+            return None
+        self.cache_dict[key] = row[0]
+        return row[0]
+
     def clear_cache(self):
         self.cursor.execute("DELETE FROM cached_requests")
         self.conn.commit()
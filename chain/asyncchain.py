@@ -14,11 +14,16 @@ class AsyncChain(Chain):
         model: ModelAsync,
         prompt: Prompt | None = None,
         parser: Parser | None = None,
+        max_concurrency: int | None = None,
     ):
-        """Override to use ModelAsync"""
+        """
+        Override to use ModelAsync.
+        max_concurrency caps how many requests are in flight at once (None = all of them).
+        """
         self.prompt = prompt
         self.model = model
         self.parser = parser
+        self.max_concurrency = max_concurrency
         if self.prompt:
             self.input_schema = self.prompt.input_schema()  # this is a set
         else:
@@ -55,14 +60,29 @@ class AsyncChain(Chain):
             for input_variables in input_variables_list
         ]
         # Need to convert these to Response objects
-        return await asyncio.gather(*coroutines)
+        return await self._gather(coroutines)
 
     async def _run_prompt_strings(self, prompt_strings: list[str]) -> Response:
         coroutines = [
             self.model.query(prompt_string) for prompt_string in prompt_strings
         ]
         # Need to convert these to Response objects
-        return await asyncio.gather(*coroutines)
+        return await self._gather(coroutines)
+
+    async def _gather(self, coroutines: list) -> list:
+        """
+        Runs our queries concurrently, in order.
+        Providers rate-limit big bursts, so if max_concurrency is set, only that many requests run at a time.
+        """
+        if not self.max_concurrency:
+            return await asyncio.gather(*coroutines)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines))
 
     def convert_results_to_responses(self, results: list[str]) -> list[Response]:
         # Convert results to Response objects
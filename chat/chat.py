@@ -46,6 +46,7 @@ class Chat:
         self.messagestore = None  # This will be initialized in the chat method.
         self.welcome_message = "[green]Hello! Type /exit to exit.[/green]"
         self.commands = self.get_commands()
+        self.command_table = self.get_command_table()
 
     def parse_input(self, input: str) -> Callable | partial | None:
         """
@@ -53,22 +54,13 @@ class Chat:
         If command takes a param, this returns a partial function.
         If command is not found, it returns None (and the chat loop will handle it).
         """
-        commands = self.get_commands()
-
         # Not a command; return None.
         if not input.startswith("/"):
             return None
 
         # Parse for the type of command; this also involves catching parameters.
-        for command in commands:
-            command_string = command.replace("command_", "").replace("_", " ")
+        for command_string, command, parametrized in self.command_table:
             if input.startswith("/" + command_string):
-                # Check if the command has parameters
-                sig = inspect.signature(getattr(self, command))
-                if sig.parameters:
-                    parametrized = True
-                else:
-                    parametrized = False
                 # Check if input has parameters
                 param = input[len(command_string) + 2 :]
                 # Conditional return
@@ -91,6 +83,18 @@ class Chat:
         commands = [attr for attr in dir(self) if attr.startswith("command_")]
         return commands
 
+    def get_command_table(self) -> list[tuple[str, str, bool]]:
+        """
+        Precomputes (command string, method name, takes a parameter) for each command.
+        inspect.signature is slow, and none of this changes between user inputs, so we do it once at init.
+        """
+        command_table = []
+        for command in self.commands:
+            command_string = command.replace("command_", "").replace("_", " ")
+            parametrized = bool(inspect.signature(getattr(self, command)).parameters)
+            command_table.append((command_string, command, parametrized))
+        return command_table
+
     # Command methods
     def command_exit(self):
         """
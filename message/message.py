@@ -44,6 +44,9 @@ def create_system_message(system_prompt: str, input_variables=None) -> Message:
     Takes a system prompt object (Prompt()) or a string, an optional input object, and returns a Message object.
     """
     if isinstance(system_prompt, str):
+        if not input_variables:
+            # Nothing to render, so there's no need to build a Prompt (and compile its template).
+            return Message(role="system", content=system_prompt)
         system_prompt = Prompt(system_prompt)
     if input_variables:
         system_message = [
@@ -13,7 +13,8 @@ Under the hood, a messagestore is a list that may contain either Response or Mes
 or a mix of both, but the interaction with them is as a list of messages unless otherwise specified.
 
 "History" vs. "Log":
-    - The history is a hardcode list of messages in pickle format.
+    - The history is a hardcode list of messages in pickle format, written as a series of pickled lists:
+      save() rewrites the file as one list, and new messages are appended as another (optionally buffered, see flush()).
     - The log is a file that is automatically updated with the messages, and is formatted for human readability.
     - History is invoked by the user.
     - Log is automatically updated with the messages and therefore a flag for several methods.
@@ -25,9 +26,22 @@ from rich.rule import Rule
 from pydantic import BaseModel
 import os
 import pickle
+import weakref
 from pathlib import Path
 
 
+def _write_pending(history_file: str | Path, pending: list) -> None:
+    """
+    Appends buffered messages to a history file as one more pickle, and empties the buffer.
+    Takes the file and buffer rather than the store so it can run as the store's finalizer
+    (when it is garbage-collected, or at interpreter exit).
+    """
+    if pending:
+        with open(history_file, "ab") as file:
+            pickle.dump(pending, file)
+        pending.clear()
+
+
 class MessageStore:
     """
     Defines a message store object.
@@ -39,6 +53,7 @@ class MessageStore:
         history_file: str | Path = "",
         log_file: str | Path = "",
         pruning: bool = False,
+        write_buffer_size: int = 1,
     ):
         """
         Initializes the message store, and loads the history from a file.
@@ -68,6 +83,15 @@ class MessageStore:
             self.logging = False
         # Set the prune flag
         self.pruning = pruning
+        # How many of our messages are in the history file; None until we've loaded or saved.
+        self._saved_count: int | None = None
+        # Messages added since the last write; appended to the file once there are write_buffer_size of them.
+        # The default of 1 writes every add straight away. The buffer is only ever emptied in place,
+        # so the finalizer below sees the same list and flushes whatever is left.
+        self.write_buffer_size = write_buffer_size
+        self._pending: list[Message] = []
+        if self.persistent:
+            weakref.finalize(self, _write_pending, self.history_file, self._pending)
 
     def write_to_log(self, item: str | BaseModel) -> None:
         """
@@ -103,16 +127,22 @@ class MessageStore:
         if not self.persistent:
             print("This message store is not persistent.")
             return
+        # Don't lose anything added since our last write.
+        self.flush()
         try:
+            messages = []
             with open(self.history_file, "rb") as file:
-                self.messages = pickle.load(file)
+                while True:
+                    try:
+                        messages.extend(pickle.load(file))
+                    except EOFError:
+                        break
+            self.messages = messages
+            self._saved_count = len(messages)
             if self.pruning:
                 self.prune()
         except FileNotFoundError:
             self.save()
-        except EOFError:
-            self.messages = []
-            self.save()
 
     def save(self):
         """
@@ -124,6 +154,33 @@ class MessageStore:
         if self.persistent:
             with open(self.history_file, "wb") as file:
                 pickle.dump(self.messages, file)
+            self._saved_count = len(self.messages)
+            self._pending.clear()
+
+    def flush(self):
+        """
+        Appends any buffered messages to the history file, as one more pickle.
+        """
+        if self.persistent and self._pending:
+            self._saved_count += len(self._pending)
+            _write_pending(self.history_file, self._pending)
+
+    def _persist(self, new_messages: list[Message]):
+        """
+        Records newly added messages for the history file.
+        If the file (plus our buffer) already holds everything before them, we buffer them for the next flush;
+        otherwise (not loaded yet, pruned, etc.) we fall back to a full save.
+        """
+        if (
+            self._saved_count is not None
+            and self._saved_count + len(self._pending)
+            == len(self.messages) - len(new_messages)
+        ):
+            self._pending.extend(new_messages)
+            if len(self._pending) >= self.write_buffer_size:
+                self.flush()
+        else:
+            self.save()
 
     def prune(self):
         """
@@ -131,23 +188,27 @@ class MessageStore:
         """
         if len(self.messages) > 10:
             self.messages = self.messages[-10:]
+            # Rewrite the history file to match (this also covers anything still buffered).
+            if self.persistent:
+                self.save()
 
     def add(self, message: "Message | list[Message]"):
         """
         Add an existing message object to messages.
         """
         if isinstance(message, Message):
-            self.messages.append(message)
+            new_messages = [message]
         elif isinstance(message, list):
-            self.messages.extend(message)
+            new_messages = list(message)
         else:
             raise TypeError(
                 "Message must be a Message object or list of Message objects"
             )
+        self.messages.extend(new_messages)
         if self.logging:
             self.write_to_log(self.messages[-1])
         if self.persistent:
-            self.save()
+            self._persist(new_messages)
 
     def add_new(self, role: str, content: str):
         """
@@ -157,7 +218,7 @@ class MessageStore:
         if self.logging:
             self.write_to_log(self.messages[-1])
         if self.persistent:
-            self.save()
+            self._persist(self.messages[-1:])
 
     def last(self):
         """
@@ -182,6 +243,8 @@ class MessageStore:
                 os.remove(self.history_file)
             except FileNotFoundError:
                 pass
+            self._saved_count = None
+            self._pending.clear()
 
     def view_history(self):
         """
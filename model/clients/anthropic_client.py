@@ -3,12 +3,16 @@ Client subclass for Anthropic models.
 """
 
 from Chain.model.clients.client import Client
-from Chain.message.message import Message
 from Chain.model.clients.load_env import load_env
 from anthropic import Anthropic, AsyncAnthropic
 import instructor
 from pydantic import BaseModel
 import os
+from types import MappingProxyType
+
+# Output token limits for models that allow more than the default; shared by sync and async clients.
+max_tokens_by_model = MappingProxyType({"claude-3-5-sonnet-20240620": 8192})
+default_max_tokens = 4096
 
 
 class AnthropicClient(Client):
@@ -58,7 +62,7 @@ class AnthropicClientSync(AnthropicClient):
         # Anthropic requires a system variable
         system = ""
         if isinstance(input, str):
-            input = [Message(role="user", content=input)]
+            input = [{"role": "user", "content": input}]
         elif isinstance(input, list):
             input = input
             # This is anthropic quirk; we remove the system message and set it as a query parameter.
@@ -75,10 +79,7 @@ class AnthropicClientSync(AnthropicClient):
             )
 
         # set max_tokens based on model
-        if model == "claude-3-5-sonnet-20240620":
-            max_tokens = 8192
-        else:
-            max_tokens = 4096
+        max_tokens = max_tokens_by_model.get(model, default_max_tokens)
         # call our client
         response = self._client.chat.completions.create(
             # model = self.model,
@@ -119,7 +120,7 @@ class AnthropicClientAsync(AnthropicClient):
         # Anthropic requires a system variable
         system = ""
         if isinstance(input, str):
-            input = [Message(role="user", content=input)]
+            input = [{"role": "user", "content": input}]
         elif isinstance(input, list):
             input = input
             # This is anthropic quirk; we remove the system message and set it as a query parameter.
@@ -136,10 +137,7 @@ class AnthropicClientAsync(AnthropicClient):
             )
 
         # set max_tokens based on model
-        if model == "claude-3-5-sonnet-20240620":
-            max_tokens = 8192
-        else:
-            max_tokens = 4096
+        max_tokens = max_tokens_by_model.get(model, default_max_tokens)
         # call our client
         response = await self._client.chat.completions.create(
             # model = self.model,
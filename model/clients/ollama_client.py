@@ -88,6 +88,9 @@ class OllamaClient(Client):
         ollama_models = [m["name"] for m in ollama.list()["models"]]
         with open(dir_path / "models.json", "r") as f:
             model_list = json.load(f)
+        # Only rewrite when the list changed; a rewrite invalidates Model.models' cached parse.
+        if model_list.get("ollama") == ollama_models:
+            return
         model_list["ollama"] = ollama_models
         with open(dir_path / "models.json", "w") as f:
             json.dump(model_list, f)
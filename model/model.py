@@ -1,11 +1,50 @@
 from pathlib import Path
 import importlib
 import json
-import itertools
+import asyncio
+import os
+from functools import lru_cache
 from Chain.cache.cache import ChainCache, CachedRequest
 from pydantic import BaseModel
 
 dir_path = Path(__file__).resolve().parent
+models_path = str(dir_path / "clients/models.json")
+aliases_path = str(dir_path / "aliases.json")
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parses a JSON file. Keyed on mtime and size, so an edited file (e.g. a refreshed Ollama list) is re-read.
+    The returned dict is shared between callers, so it stays private to this module; Model.models hands out copies.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+# Priority when a model name shows up under more than one provider; providers not listed here come last.
+_provider_order = {
+    provider: rank
+    for rank, provider in enumerate(
+        ("openai", "anthropic", "google", "ollama", "groq", "deepseek", "perplexity")
+    )
+}
+
+
+@lru_cache(maxsize=8)
+def _provider_index(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """
+    Maps every model name in models.json (under any provider) to its provider, so client lookup is one dict get.
+    Cached on the same key as _load_json.
+    """
+    model_list = _load_json(path, mtime_ns, size)
+    index = {}
+    for provider in sorted(
+        model_list, key=lambda p: _provider_order.get(p, len(_provider_order))
+    ):
+        for model in model_list[provider]:
+            index.setdefault(model, provider)
+    return index
 
 
 class Model:
@@ -13,13 +52,36 @@ class Model:
     # Load models from the JSON file. Why classmethod and property?
     # Because models is a class-level variable (Model.models, not model.models).
     # We want it to dynamically load the models from the models file everytime you access the attribute, because Ollama models can change.
+    # The parse is cached until the file's mtime or size changes, so repeated access only costs a stat.
+    # Callers get their own copy; the cached parse stays internal (_provider_index, _validate_model).
     @classmethod
     @property
     def models(cls):
-        with open(dir_path / "clients/models.json") as f:
-            return json.load(f)
+        stat = os.stat(models_path)
+        model_list = _load_json(models_path, stat.st_mtime_ns, stat.st_size)
+        return {provider: list(models) for provider, models in model_list.items()}
 
-    # Store lazy-loaded client instances at the class level
+    @classmethod
+    def _providers(cls) -> dict[str, str]:
+        """
+        Model name -> provider, built from the current models.json.
+        """
+        stat = os.stat(models_path)
+        return _provider_index(models_path, stat.st_mtime_ns, stat.st_size)
+
+    # Client class for each provider; subclasses (ModelAsync) swap in their own.
+    _client_classes = {
+        "openai": "OpenAIClientSync",
+        "anthropic": "AnthropicClientSync",
+        "google": "GoogleClient",
+        "ollama": "OllamaClient",
+        "groq": "GroqClient",
+        "deepseek": "DeepSeekClient",
+        "perplexity": "PerplexityClient",
+    }
+
+    # Store lazy-loaded client instances at the class level, keyed by (provider, client class).
+    # Every Model for the same client shares one SDK client, and with it one HTTP connection pool.
     _clients = {}
     # If you want to add a cache, add it at class level as a singleton.
     _chain_cache: ChainCache | None = None
@@ -34,10 +96,10 @@ class Model:
         """
         This is where you can put in any model aliases you want to support.
         """
-        # Load our aliases from aliases.json
+        # Load our aliases from aliases.json (parsed once per file version, like models.json)
         try:
-            with open(dir_path / "aliases.json", "r") as f:
-                aliases = json.load(f)
+            stat = os.stat(aliases_path)
+            aliases = _load_json(aliases_path, stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"WARNING: aliases.json not found. This may cause errors."
@@ -47,18 +109,17 @@ class Model:
                 f"WARNING: aliases.json is not a valid JSON file. This may cause errors."
             )
 
-        # Check data quality.
+        # Check data quality. The provider index doubles as the flattened set of every model we support.
+        available = cls._providers()
         for value in aliases.values():
-            if value not in list(itertools.chain.from_iterable(cls.models.values())):
+            if value not in available:
                 raise ValueError(
                     f"WARNING: This model declared in aliases.json is not available: {value}."
                 )
         # Assign models based on aliases
         if model in aliases.keys():
             model = aliases[model]
-        elif model in list(
-            itertools.chain.from_iterable(cls.models.values())
-        ):  # any other model we support (flattened the list)
+        elif model in available:  # any other model we support
             model = model
         else:
             ValueError(
@@ -71,37 +132,24 @@ class Model:
         Setting client_type for Model object is necessary for loading the correct client in the query functions.
         Returns a tuple with client type (which informs the module title) and the client class name (which is used to instantiate the client).
         """
-        model_list = self.__class__.models
-        if model in model_list["openai"]:
-            return "openai", "OpenAIClientSync"
-        elif model in model_list["anthropic"]:
-            return "anthropic", "AnthropicClientSync"
-        elif model in model_list["google"]:
-            return "google", "GoogleClient"
-        elif model in model_list["ollama"]:
-            return "ollama", "OllamaClient"
-        elif model in model_list["groq"]:
-            return "groq", "GroqClient"
-        elif model in model_list["deepseek"]:
-            return "deepseek", "DeepSeekClient"
-        elif model in model_list["perplexity"]:
-            return "perplexity", "PerplexityClient"
-        else:
+        provider = self._providers().get(model)
+        if provider not in self._client_classes:
             raise ValueError(f"Model {model} not found in models")
+        return provider, self._client_classes[provider]
 
     @classmethod
     def _get_client(cls, client_type: tuple):
         # print(f"client type: {client_type}")
-        if client_type[0] not in cls._clients:
+        if client_type not in cls._clients:
             try:
                 module = importlib.import_module(
                     f"Chain.model.clients.{client_type[0].lower()}_client"
                 )
                 client_class = getattr(module, f"{client_type[1]}")
-                cls._clients[client_type[0]] = client_class()
+                cls._clients[client_type] = client_class()
             except ImportError as e:
                 raise ImportError(f"Failed to import {client_type} client: {str(e)}")
-        client_object = cls._clients[client_type[0]]
+        client_object = cls._clients[client_type]
         if not client_object:
             raise ValueError(f"Client {client_type} not found in clients")
         return client_object
@@ -125,7 +173,7 @@ class Model:
                 user_input=input, model=self.model, llm_output=results
             )
             Model._chain_cache.insert_cached_request(cached_request)
-        return self._client.query(self.model, input, pydantic_model)
+        return results
 
     def pretty(self, user_input):
         pretty = user_input.replace("\n", " ").replace("\t", " ").strip()
@@ -145,40 +193,23 @@ class Model:
     ):
         if verbose:
             print(f"Model: {self.model}   Query: " + self.pretty(str(input)))
-        if Model._chain_cache:
-            cached_request = Model._chain_cache.cache_lookup(input, self.model)
-            if cached_request:
-                print("Cache hit!")
-                return cached_request
-        results = self._client.query(self.model, input, pydantic_model)
-        if Model._chain_cache:
-            cached_request = CachedRequest(
-                user_input=input, model=self.model, llm_output=results
-            )
-            Model._chain_cache.insert_cached_request(cached_request)
+        # Streams bypass the cache both ways: we'd have to consume them to store the output,
+        # and callers expect a stream back, not the cached string.
         stream = self._client.stream(self.model, input, pydantic_model)
         return stream
 
 
 class ModelAsync(Model):
+    # Queries currently in flight, keyed by (event loop, model, prompt, pydantic model).
+    # Concurrent identical requests (e.g. duplicates in an AsyncChain batch) await the same task.
+    # The loop is part of the key because each AsyncChain.run has its own, and a task can only be awaited on its own loop.
+    _inflight: dict[tuple, asyncio.Future] = {}
 
-    def _get_client_type(self, model: str) -> tuple:
-        """
-        Overrides the parent method to return the async version of each client type.
-        """
-        model_list = self.__class__.models
-        if model in model_list["openai"]:
-            return "openai", "OpenAIClientAsync"
-        elif model in model_list["anthropic"]:
-            return "anthropic", "AnthropicClientAsync"
-        # elif model in model_list["google"]:
-        #     return "google", "GoogleClient"
-        # elif model in model_list["ollama"]:
-        #     return "ollama", "OllamaClient"
-        # elif model in model_list["groq"]:
-        #     return "groq", "GroqClient"
-        else:
-            raise ValueError(f"Model {model} not found in models")
+    # Async versions of each client type; other providers don't have async clients yet.
+    _client_classes = {
+        "openai": "OpenAIClientAsync",
+        "anthropic": "AnthropicClientAsync",
+    }
 
     async def query(
         self,
@@ -190,6 +221,26 @@ class ModelAsync(Model):
             cached_request = Model._chain_cache.cache_lookup(input, self.model)
             if cached_request:
                 return cached_request
+        # Message lists aren't hashable, so only string prompts are coalesced.
+        if not isinstance(input, str):
+            return await self._query(input, verbose, pydantic_model)
+        key = (asyncio.get_running_loop(), self.model, input, pydantic_model)
+        if key not in ModelAsync._inflight:
+            task = asyncio.ensure_future(self._query(input, verbose, pydantic_model))
+            task.add_done_callback(lambda _: ModelAsync._inflight.pop(key, None))
+            ModelAsync._inflight[key] = task
+        # Shield so one caller being cancelled doesn't cancel the request for everyone else.
+        return await asyncio.shield(ModelAsync._inflight[key])
+
+    async def _query(
+        self,
+        input: str | list,
+        verbose: bool = True,
+        pydantic_model: BaseModel | None = None,
+    ) -> BaseModel | str:
+        """
+        The actual provider call; query() decides whether we need to make it.
+        """
         if verbose:
             print(f"Model: {self.model}   Query: " + self.pretty(str(input)))
         results = await self._client.query(self.model, input, pydantic_model)
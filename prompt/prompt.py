@@ -3,6 +3,7 @@ Prompt class -- coordinates templates, input variables, and rendering.
 """
 
 from jinja2 import Environment, StrictUndefined, meta
+from functools import lru_cache
 
 # Define jinja2 environment that we will use across all prompts.
 env = Environment(
@@ -10,6 +11,25 @@ env = Environment(
 )  # set jinja2 to throw errors if a variable is undefined
 
 
+@lru_cache(maxsize=1024)
+def _extract_variables(prompt_string: str) -> frozenset:
+    """
+    Parses a prompt string and returns its undeclared variables.
+    Prompt strings don't change, so we only pay for the jinja2 parse once per string.
+    """
+    parsed_content = env.parse(prompt_string)
+    return frozenset(meta.find_undeclared_variables(parsed_content))
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(prompt_string: str):
+    """
+    Compiles a prompt string into a jinja2 Template.
+    Templates are immutable once compiled, so Prompts built from the same string can share one.
+    """
+    return env.from_string(prompt_string)
+
+
 class Prompt:
     """ "
     Takes a jinja2 ready string (note: not an actual Template object; that's created by the class).
@@ -21,7 +41,7 @@ class Prompt:
 
     def __init__(self, prompt_string: str):
         self.prompt_string = prompt_string
-        self.template = env.from_string(prompt_string)
+        self.template = _compile_template(prompt_string)
 
     def render(self, input_variables: dict) -> str:
         """
@@ -37,8 +57,7 @@ class Prompt:
         Returns a set of variable names from the template.
         This can be used to validate that the input variables match the template.
         """
-        parsed_content = env.parse(self.prompt_string)
-        return meta.find_undeclared_variables(parsed_content)
+        return set(_extract_variables(self.prompt_string))
 
     def __repr__(self):
         attributes = ", ".join(
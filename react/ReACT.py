@@ -7,6 +7,23 @@ from Chain.react.Tool import Tool
 from jinja2 import Template
 from pathlib import Path
 from typing import Callable
+from functools import lru_cache
+
+# The model answers with <tool>name</tool> followed by <args>{...}</args>; one pass grabs both.
+_TOOL_CALL_PATTERN = re.compile(r"<tool>(.*?)</tool>.*?<args>(.*?)</args>", re.DOTALL)
+# Anything the model streams after </args> is dropped.
+_ARGS_TAIL_PATTERN = re.compile(r"</args>.*", re.DOTALL)
+
+
+@lru_cache(maxsize=1)
+def _system_prompt_template() -> Template:
+    """
+    Reads and compiles system_prompt.jinja once; every ReACT renders from the same Template.
+    """
+    dir_path = Path(__file__).parent
+    system_prompt_path = dir_path / "system_prompt.jinja"
+    with open(system_prompt_path, "r") as file:
+        return Template(file.read().strip())
 
 
 class ReACT:
@@ -24,13 +41,14 @@ class ReACT:
         input: str,
         output: str,
         tools: list[Callable],
-        model: Model = Model("gpt"),
+        model: Model | None = None,
         log_file: str = "",
     ):
         self.input = input
         self.output = output
         self.tools = tools
-        self.model = model
+        # Default is built here rather than in the signature, so importing ReACT doesn't create a client.
+        self.model = model if model is not None else Model("gpt")
         # Add our default to logfile
         if log_file == "":
             dir_path = Path(__file__).parent / ".react.log"
@@ -44,12 +62,8 @@ class ReACT:
         self.message_store = MessageStore(log_file=self.log_file)
 
     def load_system_prompt_template(self) -> Template:
-        # Load system prompt from jinja file
-        dir_path = Path(__file__).parent
-        system_prompt_path = dir_path / "system_prompt.jinja"
-        with open(system_prompt_path, "r") as file:
-            system_prompt_string = Template(file.read().strip())
-        return system_prompt_string
+        # Load system prompt from jinja file (cached at module level)
+        return _system_prompt_template()
 
     def render_system_prompt(self, input: str, output: str, tool_objects: list[Tool]):
         system_prompt_string = self.load_system_prompt_template()
@@ -59,33 +73,29 @@ class ReACT:
         return system_prompt
 
     def process_stream(self, stream) -> tuple[str, dict, str]:
-        buffer = ""
+        chunks = []
+        tail = ""
         for chunk in stream:
-            buffer += str(chunk.choices[0].delta.content)
-            if "</args>" in buffer:
+            content = str(chunk.choices[0].delta.content)
+            chunks.append(content)
+            # Only the newest chunk (plus enough of the last one to catch a split tag) can complete </args>.
+            window = tail + content
+            if "</args>" in window:
                 stream.close()
                 break
+            tail = window[-6:]
+        buffer = "".join(chunks)
         # Process either the args or the finish tool
-        buffer = re.sub(r"</args>.*", "</args>", buffer, flags=re.DOTALL)
+        buffer = _ARGS_TAIL_PATTERN.sub("</args>", buffer)
         # Stop token gets rendered as None, so we need to remove the last 4 characters
         if buffer.endswith("None"):
             buffer = buffer[:-4]
         # Grab two bits of data: <tool></tool> and <args></args>
-        try:
-            tool = re.search(
-                r"<tool>(.*?)</tool>", buffer, re.DOTALL
-            ).group(  # type:ignore
-                1
-            )
-            args = re.search(
-                r"<args>(.*?)</args>", buffer, re.DOTALL
-            ).group(  # type:ignore
-                1
-            )
-            args = literal_eval(args)
-            return tool, args, buffer
-        except AttributeError:
+        match = _TOOL_CALL_PATTERN.search(buffer)
+        if not match:
             return "", {}, buffer
+        tool, args = match.groups()
+        return tool, literal_eval(args), buffer
 
     def return_observation(self, observation: str) -> Message:
         observation_string = f"<observation>{observation}</observation>"
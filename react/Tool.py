@@ -1,9 +1,24 @@
-from typing import Callable
-from inspect import signature
+from typing import Callable, get_origin
+from types import FunctionType
+from inspect import signature, CO_VARARGS, CO_VARKEYWORDS
+
+
+def _type_name(annotation) -> str:
+    """
+    Readable name for an annotation: "int" for classes, "list[int]" for generics.
+    """
+    if isinstance(annotation, str):  # postponed annotations are already strings
+        return annotation
+    if get_origin(annotation) is None and hasattr(annotation, "__name__"):
+        return annotation.__name__
+    return repr(annotation).replace("typing.", "")
 
 
 # Tool class
 class Tool:
+    # A ReACT holds one Tool per function for its whole life; slots keep them small.
+    __slots__ = ("function", "description", "args", "name")
+
     def __init__(self, function: Callable):
         self.function = function
         try:
@@ -12,16 +27,35 @@ class Tool:
             print("Function needs a docstring")
         try:
             self.args = self.validate_parameters()
-        except AttributeError:
-            print("Function needs type annotations. Does this have any parameters?")
+        except AttributeError as e:
+            print(f"Function needs type annotations: {e}")
         self.name = function.__name__
 
     def validate_parameters(self):
-        sig = signature(self.function)
-        params = sig.parameters
-        param_types = {
-            name: param.annotation.__name__ for name, param in params.items()
-        }
+        if (
+            isinstance(self.function, FunctionType)
+            and not hasattr(self.function, "__wrapped__")
+            and not self.function.__code__.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+        ):
+            # Plain functions: read the code object and annotations directly, no Signature needed.
+            code = self.function.__code__
+            names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+            annotations = self.function.__annotations__
+        else:
+            # Decorated functions (inspect follows __wrapped__), *args/**kwargs, methods, partials,
+            # callable objects: let inspect work out the parameters.
+            params = signature(self.function).parameters
+            names = tuple(params)
+            annotations = {
+                name: param.annotation
+                for name, param in params.items()
+                if param.annotation is not param.empty
+            }
+        param_types = {}
+        for name in names:
+            if name not in annotations:
+                raise AttributeError(f"parameter '{name}' has no annotation")
+            param_types[name] = _type_name(annotations[name])
         return str(param_types)
 
     def __call__(self, **kwargs):
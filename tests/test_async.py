@@ -1,10 +1,11 @@
 from Chain.model.clients.openai_client import OpenAIClientAsync
 from Chain.model.clients.anthropic_client import AnthropicClientAsync
 from Chain.chain.asyncchain import AsyncChain
-from Chain.model.model import ModelAsync
+from Chain.model.model import Model, ModelAsync
 from Chain.response.response import Response
 from Chain.prompt.prompt import Prompt
 import asyncio
+import threading
 import pytest
 
 
@@ -196,3 +197,80 @@ def test_asyncchain_run_input_variables(async_chain, input_variables_list):
     assert len(results) == len(input_variables_list)
     assert all(isinstance(result, Response) for result in results)
     assert all(len(result.content) > 0 for result in results)
+
+
+# Bounded concurrency: max_concurrency caps in-flight requests without changing result order.
+def test_asyncchain_max_concurrency(
+    prompt_object, model_string, input_variables_list, monkeypatch
+):
+    monkeypatch.setattr(Model, "_chain_cache", None)
+    in_flight = {"now": 0, "peak": 0}
+
+    class SlowClient:
+        async def query(self, model, input, pydantic_model=None):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return input
+
+    model = ModelAsync(model_string)
+    model._client = SlowClient()
+    chain = AsyncChain(prompt=prompt_object, model=model, max_concurrency=1)
+    results = chain.run(input_variables_list=input_variables_list)
+    assert [result.content for result in results] == [
+        prompt_object.render(input_variables) for input_variables in input_variables_list
+    ]
+    assert in_flight["peak"] == 1
+
+
+# Identical prompts in flight at the same time share a single provider call.
+def test_asyncchain_coalesces_duplicate_prompts(model_string, monkeypatch):
+    monkeypatch.setattr(Model, "_chain_cache", None)
+    calls = []
+
+    class CountingClient:
+        async def query(self, model, input, pydantic_model=None):
+            calls.append(input)
+            await asyncio.sleep(0.01)
+            return input.upper()
+
+    model = ModelAsync(model_string)
+    model._client = CountingClient()
+    chain = AsyncChain(model=model)
+    prompt_strings = ["Name five frogs.", "Name five cars.", "Name five frogs."]
+    results = chain.run(prompt_strings=prompt_strings)
+    assert [result.content for result in results] == [p.upper() for p in prompt_strings]
+    assert sorted(calls) == ["Name five cars.", "Name five frogs."]
+    assert ModelAsync._inflight == {}
+
+
+# Each AsyncChain.run has its own event loop, so identical prompts in different threads aren't coalesced.
+def test_asyncchain_same_prompt_in_two_threads(model_string, monkeypatch):
+    monkeypatch.setattr(Model, "_chain_cache", None)
+    barrier = threading.Barrier(2)
+    results, errors = [], []
+
+    class SlowClient:
+        async def query(self, model, input, pydantic_model=None):
+            await asyncio.sleep(0.05)
+            return input.upper()
+
+    model = ModelAsync(model_string)
+    model._client = SlowClient()
+
+    def run_chain():
+        try:
+            barrier.wait()
+            chain = AsyncChain(model=model)
+            results.extend(chain.run(prompt_strings=["Name five frogs."]))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run_chain) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert [result.content for result in results] == ["NAME FIVE FROGS."] * 2
@@ -1,5 +1,5 @@
 from Chain import Model, Prompt, Chain
-from Chain.cache.cache import ChainCache
+from Chain.cache.cache import ChainCache, CachedRequest
 from time import time
 
 m = Model("gpt")
@@ -71,3 +71,27 @@ def test_cache():
     cached_time = cached_end - cached_start
     # Assert cached is significantly faster (e.g. .01 seconds versus 3 seconds)
     assert cached_time < uncached_time - 2
+
+
+def test_cache_loads_existing_rows(tmp_path):
+    db = str(tmp_path / "cache.db")
+    first = ChainCache(db)
+    first.insert_cached_request(
+        CachedRequest(user_input=" hello ", llm_output="hi", model="haiku")
+    )
+    second = ChainCache(db)
+    assert second.cache_dict == {("hello", "haiku"): "hi"}
+    assert second.cache_lookup("hello", "haiku") == "hi"
+
+
+def test_cache_lookup_falls_back_to_db(tmp_path):
+    db = str(tmp_path / "cache.db")
+    first = ChainCache(db)
+    second = ChainCache(db)
+    second.insert_cached_request(
+        CachedRequest(user_input="hello", llm_output="hi", model="haiku")
+    )
+    assert ("hello", "haiku") not in first.cache_dict
+    assert first.cache_lookup("hello", "haiku") == "hi"
+    assert first.cache_dict[("hello", "haiku")] == "hi"
+    assert first.cache_lookup("goodbye", "haiku") is None
@@ -0,0 +1,87 @@
+from Chain.message.messagestore import MessageStore
+from Chain.message.message import Message
+import pickle
+import gc
+
+
+def test_messagestore_round_trip(tmp_path):
+    history_file = tmp_path / "history.pickle"
+    store = MessageStore(history_file=history_file)
+    store.load()
+    store.add_new("user", "hello")
+    store.add([Message(role="assistant", content="hi"), Message(role="user", content="bye")])
+    store.flush()
+    reloaded = MessageStore(history_file=history_file)
+    reloaded.load()
+    assert [m.content for m in reloaded.messages] == ["hello", "hi", "bye"]
+
+
+def test_messagestore_loads_legacy_history(tmp_path):
+    history_file = tmp_path / "history.pickle"
+    with open(history_file, "wb") as file:
+        pickle.dump([Message(role="user", content="old")], file)
+    store = MessageStore(history_file=history_file)
+    store.load()
+    store.add_new("assistant", "new")
+    store.flush()
+    reloaded = MessageStore(history_file=history_file)
+    reloaded.load()
+    assert [m.content for m in reloaded.messages] == ["old", "new"]
+
+
+def test_messagestore_prune_and_clear_rewrite_history(tmp_path):
+    history_file = tmp_path / "history.pickle"
+    store = MessageStore(history_file=history_file)
+    store.load()
+    for i in range(15):
+        store.add_new("user", str(i))
+    store.flush()
+    pruned = MessageStore(history_file=history_file, pruning=True)
+    pruned.load()
+    assert [m.content for m in pruned.messages] == [str(i) for i in range(5, 15)]
+    pruned.clear()
+    reloaded = MessageStore(history_file=history_file)
+    reloaded.load()
+    assert reloaded.messages == []
+
+
+def test_messagestore_buffers_writes(tmp_path):
+    history_file = tmp_path / "history.pickle"
+    store = MessageStore(history_file=history_file, write_buffer_size=3)
+    store.load()
+    store.add_new("user", "one")
+    store.add_new("assistant", "two")
+    on_disk = MessageStore(history_file=history_file)
+    on_disk.load()
+    assert on_disk.messages == []
+    store.add_new("user", "three")
+    on_disk.load()
+    assert [m.content for m in on_disk.messages] == ["one", "two", "three"]
+
+
+def test_messagestore_flushes_pending_when_collected(tmp_path):
+    history_file = tmp_path / "history.pickle"
+
+    def chat():
+        store = MessageStore(history_file=history_file, write_buffer_size=10)
+        store.load()
+        store.add_new("user", "one")
+        store.add_new("assistant", "two")
+
+    chat()
+    gc.collect()
+    reloaded = MessageStore(history_file=history_file)
+    reloaded.load()
+    assert [m.content for m in reloaded.messages] == ["one", "two"]
+
+
+def test_messagestore_prune_keeps_buffered_messages(tmp_path):
+    history_file = tmp_path / "history.pickle"
+    store = MessageStore(history_file=history_file, write_buffer_size=100)
+    store.load()
+    for i in range(15):
+        store.add_new("user", str(i))
+    store.prune()
+    reloaded = MessageStore(history_file=history_file)
+    reloaded.load()
+    assert [m.content for m in reloaded.messages] == [str(i) for i in range(5, 15)]
@@ -1,6 +1,10 @@
 from Chain import Model
+from Chain.model.model import ModelAsync, _provider_index
 from Chain.model.clients.client import Client
+from Chain.cache.cache import ChainCache, CachedRequest
 import pytest
+import json
+import os
 
 
 @pytest.fixture
@@ -44,3 +48,75 @@ def test_model_get_client(model_name, provider, client):
     model = Model(model_name)
     client = model._get_client((provider, client))
     assert isinstance(client, Client)
+
+
+def test_model_clients_shared_per_client_class():
+    """
+    Sync and async models for the same provider each get their own client, shared across instances.
+    """
+    sync_model = Model("gpt-4o")
+    async_model = ModelAsync("gpt-4o")
+    assert Model("gpt-4o-mini")._client is sync_model._client
+    assert sync_model._client is not async_model._client
+    assert type(async_model._client).__name__ == "OpenAIClientAsync"
+
+
+class CountingClient:
+    """
+    Stand-in client that records how often the provider would have been called.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, model, input, pydantic_model=None):
+        self.calls += 1
+        return "response"
+
+    def stream(self, model, input, pydantic_model=None):
+        self.calls += 1
+        return iter(["response"])
+
+
+def test_model_query_calls_client_once(default_model, monkeypatch):
+    monkeypatch.setattr(Model, "_chain_cache", None)
+    default_model._client = CountingClient()
+    assert default_model.query("is this thing on?", verbose=False) == "response"
+    assert default_model._client.calls == 1
+
+
+def test_model_stream_calls_client_once(default_model, monkeypatch):
+    monkeypatch.setattr(Model, "_chain_cache", None)
+    default_model._client = CountingClient()
+    assert list(default_model.stream("is this thing on?", verbose=False)) == ["response"]
+    assert default_model._client.calls == 1
+
+
+def test_model_stream_bypasses_cache(default_model, monkeypatch, tmp_path):
+    cache = ChainCache(str(tmp_path / "cache.db"))
+    cache.insert_cached_request(
+        CachedRequest(
+            user_input="is this thing on?", llm_output="cached", model=default_model.model
+        )
+    )
+    monkeypatch.setattr(Model, "_chain_cache", cache)
+    default_model._client = CountingClient()
+    assert list(default_model.stream("is this thing on?", verbose=False)) == ["response"]
+    assert default_model._client.calls == 1
+    assert len(cache) == 1
+
+
+def test_model_models_returns_copy():
+    Model.models["openai"].append("not-a-real-model")
+    assert "not-a-real-model" not in Model.models["openai"]
+    assert "not-a-real-model" not in Model._providers()
+
+
+def test_provider_index_covers_every_provider(tmp_path):
+    path = tmp_path / "models.json"
+    path.write_text(
+        json.dumps({"newprovider": ["shared", "new-model"], "openai": ["shared"]})
+    )
+    stat = os.stat(path)
+    index = _provider_index(str(path), stat.st_mtime_ns, stat.st_size)
+    assert index == {"shared": "openai", "new-model": "newprovider"}
@@ -0,0 +1,37 @@
+from Chain import Prompt
+import pytest
+
+# Our fixtures
+# ======================================================================================
+
+
+@pytest.fixture
+def sample_prompt():
+    return Prompt("Name ten {{things}} that are {{color}}.")
+
+
+# Our tests
+# ======================================================================================
+
+
+def test_prompt_input_schema(sample_prompt):
+    assert sample_prompt.input_schema() == {"things", "color"}
+
+
+def test_prompt_input_schema_is_cached(sample_prompt):
+    # Each call returns a fresh set, so callers can't mutate the cached scan.
+    schema = sample_prompt.input_schema()
+    schema.add("extra")
+    assert Prompt(sample_prompt.prompt_string).input_schema() == {"things", "color"}
+
+
+def test_prompt_render(sample_prompt):
+    rendered = sample_prompt.render({"things": "frogs", "color": "red"})
+    assert rendered == "Name ten frogs that are red."
+
+
+def test_prompt_shares_compiled_template():
+    first = Prompt("Hello, {{ name }}!")
+    second = Prompt("Hello, {{ name }}!")
+    assert first.template is second.template
+    assert second.render({"name": "Ada"}) == "Hello, Ada!"
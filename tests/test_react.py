@@ -0,0 +1,76 @@
+from Chain.react.Tool import Tool
+from typing import Optional
+from functools import wraps
+
+
+# Our tests
+# ======================================================================================
+
+
+def test_tool_args_simple_types():
+    def convert_temperature(celsius: float, unit: str = "F") -> float:
+        """Converts celsius to another unit."""
+        return celsius
+
+    tool = Tool(convert_temperature)
+    assert tool.name == "convert_temperature"
+    assert tool.description == "Converts celsius to another unit."
+    assert tool.args == str({"celsius": "float", "unit": "str"})
+
+
+def test_tool_args_generic_types():
+    def pick(options: list[str], limit: Optional[int] = None) -> str:
+        """Picks an option."""
+        return options[0]
+
+    tool = Tool(pick)
+    assert tool.args == str({"options": "list[str]", "limit": "Optional[int]"})
+
+
+def test_tool_args_bound_method():
+    class Calculator:
+        def add(self, a: int, b: int) -> int:
+            """Adds two numbers."""
+            return a + b
+
+    tool = Tool(Calculator().add)
+    assert tool.args == str({"a": "int", "b": "int"})
+    assert tool(a=1, b=2) == 3
+
+
+def test_tool_args_decorated_function():
+    def logged(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    @logged
+    def get_weather(city: str, days: int) -> str:
+        """Gets the weather forecast."""
+        return f"{city}: sunny for {days} days"
+
+    tool = Tool(get_weather)
+    assert tool.name == "get_weather"
+    assert tool.args == str({"city": "str", "days": "int"})
+    assert tool(city="Paris", days=2) == "Paris: sunny for 2 days"
+
+
+def test_tool_args_varargs():
+    def total(*numbers: int, **options: bool) -> int:
+        """Adds numbers."""
+        return sum(numbers)
+
+    tool = Tool(total)
+    assert tool.args == str({"numbers": "int", "options": "bool"})
+
+
+def test_tool_args_missing_annotation(capsys):
+    def shout(text):
+        """Shouts."""
+        return text.upper()
+
+    tool = Tool(shout)
+    assert "parameter 'text' has no annotation" in capsys.readouterr().out
+    assert not hasattr(tool, "args")